@@ -102,6 +102,25 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/ref/settings/#caches
+
+# Cached GitHub responses are shared by the web, bot and Celery processes. The cache
+# uses its own Redis database, as clearing it flushes the whole database and must not
+# touch the Celery broker and results in REDIS_URL.
+CACHES = {
+    "default": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ.get("REDIS_CACHE_URL"),
+            "KEY_PREFIX": "tracker",
+        }
+        if os.environ.get("REDIS_CACHE_URL")
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    )
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -145,6 +164,7 @@ STATIC_ROOT = BASE_DIR / "static"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 AUTH_USER_MODEL = "tracker.CustomUser"
+TEST_RUNNER = "tracker.tests.runner.TimeLoggingTestRunner"
 LOGOUT_REDIRECT_URL = "/"
 
 GITHUB_AUTH_TOKEN = os.environ.get("GITHUB_AUTH_TOKEN")
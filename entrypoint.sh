@@ -7,7 +7,7 @@ echo "Applying migrations"
 python manage.py migrate
 
 echo "Running tests"
-python manage.py test
+python manage.py test --parallel auto
 
 echo "Starting the server, celery and bot..."
 exec "$@"
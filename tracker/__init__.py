@@ -1,2 +1,5 @@
-from tracker.utils import get_issues_without_pull_requests
-from tracker.values import ISSUES_URL, PULLS_URL
+from tracker.utils import (
+    get_issues_url,
+    get_issues_without_pull_requests,
+    get_pulls_url,
+)
@@ -1,11 +1,9 @@
-import asyncio
-
 from django.contrib import admin
 from django.contrib.auth.models import Group
 from django.db.models import QuerySet
 from django.forms import BaseModelForm
-from django.utils.html import format_html
-from django.utils.safestring import SafeString
+from django.utils.html import escape
+from django.utils.safestring import SafeString, mark_safe
 from django_celery_beat.models import (
     ClockedSchedule,
     CrontabSchedule,
@@ -17,7 +15,8 @@ from django_celery_beat.models import (
 from .choices import Roles
 from .bases import PredefinedUserAdminBase
 from .models import Contributor, Repository, Support, CustomUser
-from .telegram.bot import create_tg_link
+from .telegram.bot import get_tg_link
+from .values import TELEGRAM_LINK_TEMPLATE
 
 admin.site.unregister(Group)
 admin.site.unregister(IntervalSchedule)
@@ -53,11 +52,9 @@ class RepositoryAdmin(PredefinedUserAdminBase):
         :return: SafeString
         """
 
-        link = asyncio.run(create_tg_link(obj.user.id))
+        link = get_tg_link(obj.user_id)
 
-        return format_html(
-            '<a href="{}" target="_blank">Get info about repository</a>', link
-        )
+        return mark_safe(TELEGRAM_LINK_TEMPLATE.format(escape(link)))
 
     def get_queryset(self, request) -> QuerySet:
         """
@@ -82,6 +79,7 @@ class ContributorAdmin(admin.ModelAdmin):
     """
 
     list_display = ("user", "role", "rank", "notes")
+    list_select_related = ("user",)
 
     def has_module_permission(self, request) -> bool:
         """
@@ -108,7 +106,9 @@ class ContributorAdmin(admin.ModelAdmin):
 
         form.base_fields["role"].initial = Roles.CONTRIBUTOR
         form.base_fields["role"].disabled = True
-        form.base_fields["user"].queryset = CustomUser.objects.filter(role=Roles.CONTRIBUTOR)
+        form.base_fields["user"].queryset = CustomUser.objects.filter(
+            role=Roles.CONTRIBUTOR
+        ).only("id", "email")
 
         return form
 
@@ -1,3 +1,5 @@
+import logging
+
 from asgiref.sync import async_to_sync
 from celery import shared_task
 
@@ -5,6 +7,9 @@ from .models import TelegramUser
 from .telegram.bot import send_revision_messages
 from .utils import get_user_revisions
 
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
 
 @shared_task
 def fetch_approvals(telegram_id: str) -> None:
@@ -16,10 +21,15 @@ def fetch_approvals(telegram_id: str) -> None:
     :returns None
     """
 
-    telegram_user = TelegramUser.objects.filter(telegram_id=telegram_id).first()
-    if not telegram_user:
+    user_telegram_id = (
+        TelegramUser.objects.filter(telegram_id=telegram_id)
+        .values_list("telegram_id", flat=True)
+        .first()
+    )
+    if user_telegram_id is None:
+        logger.info(f"Telegram user {telegram_id} not found, skipping approvals")
         return
 
-    reviews = get_user_revisions(str(telegram_user.telegram_id))
+    reviews = get_user_revisions(user_telegram_id)
     if reviews:
-        async_to_sync(send_revision_messages)(telegram_user.telegram_id, reviews)
+        async_to_sync(send_revision_messages)(user_telegram_id, reviews)
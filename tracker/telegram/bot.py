@@ -2,6 +2,7 @@ import asyncio
 import logging
 import os
 import sys
+from functools import lru_cache
 
 from aiogram import Bot, Dispatcher, F
 from aiogram.client.default import DefaultBotProperties
@@ -11,7 +12,7 @@ from aiogram.utils.deep_linking import create_start_link
 from aiogram.utils.keyboard import ReplyKeyboardBuilder, ReplyKeyboardMarkup
 from dotenv import load_dotenv
 
-from tracker import ISSUES_URL, PULLS_URL, get_issues_without_pull_requests
+from tracker import get_issues_url, get_issues_without_pull_requests, get_pulls_url
 from tracker.telegram.templates import TEMPLATES
 from tracker.utils import (
     attach_link_to_issue,
@@ -19,9 +20,11 @@ from tracker.utils import (
     get_all_available_issues,
     get_all_repostitories,
     get_contributor_issues,
-    get_repository_support,
+    get_repositories_with_support,
     get_support_link,
     get_user,
+    github_executor,
+    split_message,
 )
 
 load_dotenv()
@@ -48,9 +51,7 @@ async def auth_link_handler(message: Message, command: CommandObject) -> None:
     uuid = command.args
     user = await get_user(uuid)
 
-    await create_telegram_user(
-        user=next(iter(user)), telegram_id=str(message.from_user.id)
-    )
+    await create_telegram_user(user=user, telegram_id=str(message.from_user.id))
     message_text = TEMPLATES.greeting.substitute(
         user_mention=message.from_user.mention_html()
     )
@@ -85,31 +86,39 @@ async def send_deprecated_issue_assignees(msg: Message) -> None:
     """
     all_repositories = await get_all_repostitories(msg.from_user.id)
 
-    for repository in all_repositories:
+    # GitHub requests are blocking, so fetch all repositories concurrently in threads.
+    # These threads only wait, as the requests themselves run on the shared GitHub
+    # executor, which bounds them no matter how many repositories there are.
+    repositories_issues = await asyncio.gather(
+        *[
+            asyncio.to_thread(
+                get_issues_without_pull_requests,
+                issues_url=get_issues_url(
+                    repository.get("author", str()), repository.get("name", str())
+                ),
+                pull_requests_url=get_pulls_url(
+                    repository.get("author", str()), repository.get("name", str())
+                ),
+            )
+            for repository in all_repositories
+        ]
+    )
+
+    for repository, issues in zip(all_repositories, repositories_issues):
 
         repo_message = TEMPLATES.repo_header.substitute(
             author=repository.get("author", "Unknown"),
             repo=repository.get("name", "Unknown"),
         )
 
-        issues = get_issues_without_pull_requests(
-            issues_url=ISSUES_URL.format(
-                owner=repository.get("author", str()),
-                repo=repository.get("name", str()),
-            ),
-            pull_requests_url=PULLS_URL.format(
-                owner=repository.get("author", str()),
-                repo=repository.get("name", str()),
-            ),
-        )
-
-        issue_messages = ""
-        for issue in issues:
-            issue_messages += TEMPLATES.issue_detail.substitute(
+        issue_messages = "".join(
+            TEMPLATES.issue_detail.substitute(
                 title=attach_link_to_issue(issue=issue),
                 user=issue.get("assignee", {}).get("login", "Unassigned"),
                 days=issue.get("days", "N/A"),
             )
+            for issue in issues
+        )
 
         if not issues:
             issue_messages = TEMPLATES.no_missed_deadlines.template
@@ -128,25 +137,33 @@ async def send_available_issues(msg: Message) -> None:
     """
     all_repositories = await get_all_repostitories(msg.from_user.id)
 
-    for repository in all_repositories:
+    # GitHub requests are blocking, so fetch all repositories concurrently on the
+    # shared GitHub executor, which bounds the threads no matter how many there are
+    loop = asyncio.get_running_loop()
+    repositories_issues = await asyncio.gather(
+        *[
+            loop.run_in_executor(
+                github_executor,
+                get_all_available_issues,
+                get_issues_url(
+                    repository.get("author", str()), repository.get("name", str())
+                ),
+            )
+            for repository in all_repositories
+        ]
+    )
+
+    for repository, issues in zip(all_repositories, repositories_issues):
         repo_message = TEMPLATES.repo_header.substitute(
             author=repository.get("author", "Unknown"),
             repo=repository.get("name", "Unknown"),
         )
 
-        issues = get_all_available_issues(
-            ISSUES_URL.format(
-                owner=repository.get("author", str()),
-                repo=repository.get("name", str()),
-            ),
+        issue_messages = "".join(
+            TEMPLATES.issue_summary.substitute(title=attach_link_to_issue(issue))
+            for issue in issues
         )
 
-        issue_messages = ""
-        for issue in issues:
-            issue_messages += TEMPLATES.issue_summary.substitute(
-                title=attach_link_to_issue(issue)
-            )
-
         if not issues:
             issue_messages = TEMPLATES.no_issues.template
 
@@ -161,15 +178,16 @@ async def get_contributor_tasks(message: Message):
 
     regex = r"odhack"
 
-    issues = get_contributor_issues(username, True, True, regex)
+    issues = await asyncio.get_running_loop().run_in_executor(
+        github_executor, get_contributor_issues, username, True, True, regex
+    )
 
     msg = "ODHack Issues assigned: \n"
 
     if len(issues) > 0:
-        for issue in issues:
-            msg += TEMPLATES.issue_list_item.substitute(
-                issue=issue,
-            )
+        msg += "".join(
+            TEMPLATES.issue_list_item.substitute(issue=issue) for issue in issues
+        )
     else:
         msg = TEMPLATES.no_issues.template
     await message.reply(msg)
@@ -181,30 +199,21 @@ async def send_revision_messages(telegram_id: str, reviews_data: list[dict]) ->
     :params tele_id: The telegram user id of the user to send to
     :reviews_data: A list of all the reviews data for all pull requests associated to the user repos
     """
-    # TODO move it to `templates.py`
-    message = (
-        "=" * 50 + "\n" + "<b>Revisions and Approvals</b>" + "\n" + "=" * 50 + "\n\n"
-    )
+    message_parts = [TEMPLATES.revisions_header.template]
     for data in reviews_data:
-        message += (
-            "-------------------------------"
-            f"Repo: <b>{data['repo']}</b>"
-            "\n"
-            f"Pull Request: <b>{data['pull']}/</b>"
-            "\n"
-            f"<b>Reviews:</b>"
-            "\n"
+        message_parts.append(
+            TEMPLATES.revision_pull.substitute(repo=data["repo"], pull=data["pull"])
         )
-        for review in data["reviews"]:
-            message += (
-                f"User: <b>{review['user']['login']}</b>"
-                "\n"
-                f"State: {review['state']}"
-                "\n\n"
+        message_parts.extend(
+            TEMPLATES.revision_review.substitute(
+                user=review["user"]["login"], state=review["state"]
             )
-        message += "-------------------------------"
+            for review in data["reviews"]
+        )
+        message_parts.append(TEMPLATES.revision_footer.template)
 
-    await bot.send_message(telegram_id, message)
+    for message in split_message(message_parts):
+        await bot.send_message(telegram_id, message)
 
 
 @dp.message(F.text == "💬Contact Support💬")
@@ -214,18 +223,16 @@ async def send_support_contacts(msg: Message) -> None:
     :param msg: Message instance for communication with a user
     :return: None
     """
-    all_repositories = await get_all_repostitories(msg.from_user.id)
+    all_repositories = await get_repositories_with_support(msg.from_user.id)
 
     for repository in all_repositories:
         repo_message = TEMPLATES.repo_header.substitute(
-            author=repository.get("author", "Unknown"),
-            repo=repository.get("name", "Unknown"),
+            author=repository.author,
+            repo=repository.name,
         )
 
-        # Get support contact for this repository
-        support = await get_repository_support(
-            repository.get("author"), repository.get("name")
-        )
+        # Support contacts are prefetched together with the repositories
+        support = next(iter(repository.supports), None)
         if support:
             support_link = get_support_link(support.telegram_username)
             message = TEMPLATES.support_contact.substitute(
@@ -259,6 +266,18 @@ async def create_tg_link(uuid) -> str:
     return await create_start_link(bot=bot, payload=uuid, encode=True)
 
 
+@lru_cache(maxsize=4096)
+def get_tg_link(uuid) -> str:
+    """
+    Returns the bot deep link for a user from synchronous code.
+    The link only depends on the user id, so it is computed once per user
+    instead of starting a new event loop every time it is rendered.
+    :param uuid: The CustomUser id
+    :return: str
+    """
+    return asyncio.run(create_tg_link(uuid))
+
+
 async def start_tg_bot() -> None:
     """
     A function that starts the bot.
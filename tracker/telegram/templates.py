@@ -15,6 +15,10 @@ class TemplateNames:
     issue_list_item: Template
     support_contact: Template
     no_support: Template
+    revisions_header: Template
+    revision_pull: Template
+    revision_review: Template
+    revision_footer: Template
 
 
 TEMPLATES = TemplateNames(
@@ -44,4 +48,15 @@ TEMPLATES = TemplateNames(
     ),
     support_contact=Template("Support Contact:\n$repo_message\n$support_link"),
     no_support=Template("Support Contact:\n$repo_message\nNo support provided."),
+    revisions_header=Template(
+        "=" * 50 + "\n<b>Revisions and Approvals</b>\n" + "=" * 50 + "\n\n"
+    ),
+    revision_pull=Template(
+        "-------------------------------"
+        "Repo: <b>$repo</b>\n"
+        "Pull Request: <b>$pull/</b>\n"
+        "<b>Reviews:</b>\n"
+    ),
+    revision_review=Template("User: <b>$user</b>\nState: $state\n\n"),
+    revision_footer=Template("-------------------------------"),
 )
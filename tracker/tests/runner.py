@@ -0,0 +1,170 @@
+import time
+from unittest import TextTestResult
+
+from django.test import override_settings
+from django.test.runner import (
+    DiscoverRunner,
+    ParallelTestSuite,
+    RemoteTestResult,
+    RemoteTestRunner,
+    _init_worker,
+)
+
+from tracker.tests.values import LOCMEM_CACHES
+
+SLOW_TEST_THRESHOLD: float = 0.3
+
+
+def init_worker_with_locmem_cache(*args, **kwargs) -> None:
+    """
+    Sets up a parallel worker with an in-memory cache.
+    Forked workers inherit the override from the main process, but spawned workers
+    load the settings again, so the override is applied once more.
+    :return: None
+    """
+    _init_worker(*args, **kwargs)
+    override_settings(CACHES=LOCMEM_CACHES).enable()
+
+
+class TimeLoggingTestResult(TextTestResult):
+    """
+    A test result that reports every test running longer than SLOW_TEST_THRESHOLD seconds.
+
+    Attributes:
+        measure_durations (bool): Whether the tests are timed here. Disabled when the tests
+                                  run in parallel workers, which report their own durations.
+
+    Methods:
+        startTest: Remembers when the test started.
+        stopTest: Reports the duration of the test.
+        addTestDuration: Writes the test id and its duration if the test was slow.
+    """
+
+    measure_durations: bool = True
+
+    def startTest(self, test) -> None:
+        """
+        Remembers when the test started.
+        :param test: TestCase
+        :return: None
+        """
+        self._started_at = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test) -> None:
+        """
+        Reports the duration of the test.
+        :param test: TestCase
+        :return: None
+        """
+        if self.measure_durations:
+            self.addTestDuration(test, time.perf_counter() - self._started_at)
+
+        super().stopTest(test)
+
+    def addTestDuration(self, test, elapsed: float) -> None:
+        """
+        Writes the test id and its duration if the test was slow.
+        :param test: TestCase
+        :param elapsed: The duration of the test in seconds.
+        :return: None
+        """
+        if elapsed >= SLOW_TEST_THRESHOLD:
+            self.stream.writeln(f">>> SLOW {test.id()} {elapsed:.2f}s")
+
+
+class TimeLoggingRemoteTestResult(RemoteTestResult):
+    """
+    A parallel worker result that times each test and records the duration as an event,
+    which is replayed to TimeLoggingTestResult.addTestDuration in the main process.
+
+    Methods:
+        startTest: Remembers when the test started.
+        stopTest: Records the duration of the test.
+    """
+
+    def startTest(self, test) -> None:
+        """
+        Remembers when the test started.
+        :param test: TestCase
+        :return: None
+        """
+        self._started_at = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test) -> None:
+        """
+        Records the duration of the test.
+        :param test: TestCase
+        :return: None
+        """
+        elapsed = time.perf_counter() - self._started_at
+        self.events.append(("addTestDuration", self.test_index, elapsed))
+
+        super().stopTest(test)
+
+
+class TimeLoggingRemoteTestRunner(RemoteTestRunner):
+    resultclass = TimeLoggingRemoteTestResult
+
+
+class TimeLoggingParallelTestSuite(ParallelTestSuite):
+    """
+    A parallel test suite whose workers time their tests.
+
+    Methods:
+        run: Runs the tests in the workers and replays their events, durations included.
+    """
+
+    runner_class = TimeLoggingRemoteTestRunner
+    init_worker = init_worker_with_locmem_cache
+
+    def run(self, result):
+        """
+        Runs the tests in the workers and replays their events, durations included.
+        The replayed start and stop events arrive back-to-back, so the main process
+        does not time them itself.
+        :param result: TestResult
+        :return: TestResult
+        """
+        result.measure_durations = False
+        return super().run(result)
+
+
+class TimeLoggingTestRunner(DiscoverRunner):
+    """
+    A test runner that reports slow tests after they finish, also under --parallel.
+    The whole suite runs against an in-memory cache, so no test can clear a shared
+    Redis cache configured for the environment the tests run in.
+
+    Methods:
+        setup_test_environment: Replaces the configured cache with an in-memory one.
+        teardown_test_environment: Restores the configured cache.
+        get_resultclass: Returns the time logging result unless debugging options need their own.
+    """
+
+    parallel_test_suite = TimeLoggingParallelTestSuite
+
+    def setup_test_environment(self, **kwargs) -> None:
+        """
+        Replaces the configured cache with an in-memory one.
+        :return: None
+        """
+        super().setup_test_environment(**kwargs)
+        self._cache_override = override_settings(CACHES=LOCMEM_CACHES)
+        self._cache_override.enable()
+
+    def teardown_test_environment(self, **kwargs) -> None:
+        """
+        Restores the configured cache.
+        :return: None
+        """
+        self._cache_override.disable()
+        super().teardown_test_environment(**kwargs)
+
+    def get_resultclass(self) -> type[TextTestResult]:
+        """
+        Returns the time logging result unless --debug-sql or --pdb require their own.
+        :return: type[TextTestResult]
+        """
+        return super().get_resultclass() or TimeLoggingTestResult
@@ -1,16 +1,17 @@
 import django
+from django.apps import apps
 
-django.setup()
+if not apps.ready:
+    django.setup()
 
-from django.test import TestCase
-from faker import Faker
+from django.test import TestCase, override_settings
 
 from tracker.choices import Roles
 from tracker.models import CustomUser
-
-fake = Faker()
+from tracker.tests.values import fake
 
 
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
 class TestCustomUserManager(TestCase):
     def setUp(self):
         """Set up test data."""
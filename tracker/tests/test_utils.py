@@ -1,150 +1,350 @@
-from unittest.mock import Mock, patch
+import re
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from types import SimpleNamespace
+from unittest.mock import patch
 
+import orjson
 import requests
 from asgiref.sync import async_to_sync
-from django.test import TestCase, TransactionTestCase
-from faker import Faker
+from django.core.cache import cache
+from django.test import TestCase
 
 from tracker.choices import Roles
-from tracker.models import CustomUser, Repository, TelegramUser
+from tracker.models import CustomUser, Repository, Support, TelegramUser
+from tracker.tests.values import (
+    GITHUB_DATETIME_FORMAT,
+    LONG_TELEGRAM_ID,
+    TELEGRAM_ID,
+    fake,
+)
 from tracker.utils import (
     check_issue_assignment_events,
     create_telegram_user,
     get_all_repostitories,
+    get_contributor_issues,
+    get_github_json,
+    get_issues_search_url,
+    get_issues_url,
+    get_issues_without_pull_requests,
+    get_paginated_github_json,
+    get_pull_reviews_url,
+    get_pulls_url,
+    get_repositories_with_support,
+    get_repository_from_issue,
+    get_repository_time_limit,
     get_user,
+    get_user_repositories,
+    get_user_revisions,
+    parse_github_datetime,
+    split_message,
 )
+from tracker.values import GITHUB_MAX_PAGES, GITHUB_REQUEST_TIMEOUT
 
-# TODO: move it to `values.py` in `tracker/tests`
-fake = Faker()
-# TODO: move it to `values.py` in `tracker/tests`
-telagram_id = fake.random_int(min=100000000, max=9999999999)
+# Wrap the async utils once instead of building a new AsyncToSync on every call
+_sync_get_all_repositories = async_to_sync(get_all_repostitories)
+_sync_get_repositories_with_support = async_to_sync(get_repositories_with_support)
+_sync_get_user = async_to_sync(get_user)
+_sync_create_telegram_user = async_to_sync(create_telegram_user)
 
 
 class TestGetAllRepositories(TestCase):
-    def setUp(self):
-        self.custom_user = CustomUser.objects.create(
-            email=fake.email, role=Roles.CONTRIBUTOR
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the whole class."""
+        cls.custom_user = CustomUser.objects.create(
+            email=fake.email(), role=Roles.CONTRIBUTOR
         )
 
-        self.user = TelegramUser.objects.create(
-            telegram_id=telagram_id, user_id=self.custom_user.id
+        cls.user = TelegramUser.objects.create(
+            telegram_id=TELEGRAM_ID, user_id=cls.custom_user.id
         )
 
-        self.repo1 = Repository.objects.create(user=self.custom_user, name="TestRepo1")
-        self.repo2 = Repository.objects.create(user=self.custom_user, name="TestRepo2")
+        cls.repo1, cls.repo2 = Repository.objects.bulk_create(
+            [
+                Repository(user=cls.custom_user, name="TestRepo1"),
+                Repository(user=cls.custom_user, name="TestRepo2"),
+            ]
+        )
 
     def test_get_all_repositories_valid_user(self):
         """Test valid telegram ID fetching repositories."""
-        result = async_to_sync(get_all_repostitories)(tele_id=telagram_id)
+        with self.assertNumQueries(1):
+            result = get_user_repositories(tele_id=TELEGRAM_ID)
         self.assertEqual(len(result), 2)
+        self.assertEqual(set(result[0]), {"author", "name", "time_limit"})
         self.assertEqual(result[0]["name"], "TestRepo1")
         self.assertEqual(result[1]["name"], "TestRepo2")
 
     def test_get_all_repositories_invalid_user(self):
         """Test invalid telegram ID raises exception."""
-        result = async_to_sync(get_all_repostitories)(tele_id="987654321")
+        result = get_user_repositories(tele_id="987654321")
 
         self.assertEqual(len(result), 0)
 
+    def test_get_all_repositories_async(self):
+        """Test the async wrapper returns the same repositories."""
+        result = _sync_get_all_repositories(tele_id=TELEGRAM_ID)
+
+        self.assertEqual(result, get_user_repositories(tele_id=TELEGRAM_ID))
+
+
+class TestGetRepositoriesWithSupport(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the whole class."""
+        cls.custom_user = CustomUser.objects.create(
+            email=fake.email(), role=Roles.PROJECT_LEAD
+        )
+        cls.telegram_id = TELEGRAM_ID
+        TelegramUser.objects.create(
+            telegram_id=cls.telegram_id, user_id=cls.custom_user.id
+        )
+
+        cls.repo1 = Repository.objects.create(user=cls.custom_user, name="TestRepo1")
+        cls.repo2 = Repository.objects.create(user=cls.custom_user, name="TestRepo2")
+        cls.support = Support.objects.create(
+            user=cls.custom_user, repository=cls.repo1, telegram_username="support"
+        )
+
+    def test_supports_are_prefetched(self):
+        """Test repositories and their supports are fetched in two queries."""
+        with self.assertNumQueries(2):
+            result = _sync_get_repositories_with_support(self.telegram_id)
+            supports = {repo.name: repo.supports for repo in result}
+
+        self.assertEqual(supports["TestRepo1"], [self.support])
+        self.assertEqual(supports["TestRepo2"], [])
+
+    def test_invalid_user(self):
+        """Test invalid telegram ID returns no repositories."""
+        result = _sync_get_repositories_with_support("987654321")
+
+        self.assertEqual(result, [])
+
 
 class TestGetUser(TestCase):
-    def setUp(self):
-        """Set up test data."""
-        self.custom_user = CustomUser.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the whole class."""
+        cls.custom_user = CustomUser.objects.create(
             email=fake.email(), role=Roles.CONTRIBUTOR
         )
-        self.user_id = str(self.custom_user.id)
+        cls.user_id = str(cls.custom_user.id)
 
     def test_get_user_valid_uuid(self):
         """Test retrieving user with valid UUID."""
-        result = async_to_sync(get_user)(uuid=self.user_id)
-        self.assertIsInstance(result, tuple)
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0], self.custom_user)
+        result = _sync_get_user(uuid=self.user_id)
+        self.assertIsInstance(result, CustomUser)
+        self.assertEqual(result, self.custom_user)
 
     def test_get_user_invalid_uuid(self):
         """Test retrieving user with invalid UUID raises exception."""
         invalid_uuid = "00000000-0000-0000-0000-000000000000"
         with self.assertRaises(CustomUser.DoesNotExist):
-            async_to_sync(get_user)(uuid=invalid_uuid)
+            _sync_get_user(uuid=invalid_uuid)
+
+
+class TestGetGithubJson(TestCase):
+    def setUp(self):
+        """Start every test with an empty cache and a patched GET."""
+        self.url = "https://api.github.com/repos/owner/repo/issues"
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        patcher = patch("tracker.utils.github_session.get")
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def mock_responses(self, *responses: tuple) -> None:
+        """
+        Make the patched GET return the given (status, headers, payload[, next_url])
+        responses in order.
+        """
+        self.mock_get.side_effect = [
+            SimpleNamespace(
+                status_code=status_code,
+                headers=headers,
+                links={"next": {"url": next_url[0]}} if next_url else {},
+                content=orjson.dumps(payload),
+                raise_for_status=lambda: None,
+            )
+            for status_code, headers, payload, *next_url in responses
+        ]
+
+    def test_not_modified_returns_cached_body(self):
+        """Test a 304 response is answered from the cache with If-None-Match sent."""
+        self.mock_responses(
+            (HTTPStatus.OK, {"ETag": '"etag"'}, [{"id": 1}]),
+            (HTTPStatus.NOT_MODIFIED, {"ETag": '"etag"'}, None),
+        )
+
+        first = get_github_json(self.url, params={"state": "open"})
+        second = get_github_json(self.url, params={"state": "open"})
+
+        self.assertEqual(first, [{"id": 1}])
+        self.assertEqual(second, [{"id": 1}])
+        self.assertEqual(
+            self.mock_get.call_args.kwargs["timeout"], GITHUB_REQUEST_TIMEOUT
+        )
+        self.assertNotIn(
+            "If-None-Match", self.mock_get.call_args_list[0].kwargs["headers"]
+        )
+        self.assertEqual(
+            self.mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"], '"etag"'
+        )
+
+    def test_params_are_cached_separately(self):
+        """Test the same URL with different params does not reuse the ETag."""
+        self.mock_responses(
+            (HTTPStatus.OK, {"ETag": '"open"'}, [{"id": 1}]),
+            (HTTPStatus.OK, {"ETag": '"closed"'}, [{"id": 2}]),
+        )
+
+        get_github_json(self.url, params={"state": "open"})
+        result = get_github_json(self.url, params={"state": "closed"})
+
+        self.assertEqual(result, [{"id": 2}])
+        self.assertNotIn(
+            "If-None-Match", self.mock_get.call_args_list[1].kwargs["headers"]
+        )
+
+    def test_pages_are_followed(self):
+        """Test list endpoints are requested in full pages until no next link is left."""
+        next_url = f"{self.url}?per_page=100&page=2"
+        self.mock_responses(
+            (HTTPStatus.OK, {}, [{"id": 1}], next_url),
+            (HTTPStatus.OK, {}, [{"id": 2}]),
+        )
+
+        result = get_paginated_github_json(self.url, params={"state": "open"})
+
+        self.assertEqual(result, [{"id": 1}, {"id": 2}])
+        self.assertEqual(
+            self.mock_get.call_args_list[0].kwargs["params"],
+            {"state": "open", "per_page": 100},
+        )
+        self.assertEqual(self.mock_get.call_args_list[1].args, (next_url,))
+
+    def test_pages_are_capped(self):
+        """Test no more than GITHUB_MAX_PAGES pages are requested."""
+        self.mock_responses(
+            *[(HTTPStatus.OK, {}, [{"id": page}], self.url) for page in range(20)]
+        )
+
+        result = get_paginated_github_json(self.url)
+
+        self.assertEqual(len(result), GITHUB_MAX_PAGES)
+        self.assertEqual(self.mock_get.call_count, GITHUB_MAX_PAGES)
+
+    def test_response_without_etag_is_not_cached(self):
+        """Test responses without an ETag are always fetched again."""
+        self.mock_responses(
+            (HTTPStatus.OK, {}, [{"id": 1}]),
+            (HTTPStatus.OK, {}, [{"id": 2}]),
+        )
+
+        get_github_json(self.url)
+        result = get_github_json(self.url)
+
+        self.assertEqual(result, [{"id": 2}])
+        self.assertNotIn(
+            "If-None-Match", self.mock_get.call_args_list[1].kwargs["headers"]
+        )
 
 
 class TestCheckIssueAssignmentEvents(TestCase):
+    # Mocked events payloads mapped to the assignment info they should produce
+    ASSIGNMENT_EVENT_CASES = {
+        "successful_assignment_event": (
+            [
+                {
+                    "event": "assigned",
+                    "assignee": {"login": "testuser"},
+                    "created_at": "2024-01-01T12:00:00Z",
+                }
+            ],
+            {"assignee": "testuser", "assigned_at": "2024-01-01T12:00:00Z"},
+        ),
+        # Only the last assignment event is returned
+        "multiple_assignment_events": (
+            [
+                {
+                    "event": "assigned",
+                    "assignee": {"login": "user1"},
+                    "created_at": "2024-01-01T12:00:00Z",
+                },
+                {
+                    "event": "assigned",
+                    "assignee": {"login": "user2"},
+                    "created_at": "2024-01-02T12:00:00Z",
+                },
+            ],
+            {"assignee": "user2", "assigned_at": "2024-01-02T12:00:00Z"},
+        ),
+        "no_assignment_events": (
+            [{"event": "labeled", "label": {"name": "bug"}}],
+            {},
+        ),
+        # Missing assignee and created_at fields
+        "malformed_response": (
+            [{"event": "assigned"}],
+            {"assignee": "", "assigned_at": ""},
+        ),
+    }
+
     def setUp(self):
-        """Set up test data."""
+        """Set up test data and block real HTTP calls for every test."""
         self.issue_link = {
             "events_url": "https://api.github.com/repos/owner/repo/issues/1/events"
         }
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        patcher = patch("tracker.utils.github_session.get")
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_response([])
+
+    def mock_response(self, payload: list[dict]) -> None:
+        """Make the patched GET return the given JSON payload."""
+        self.mock_get.return_value = SimpleNamespace(
+            status_code=HTTPStatus.OK,
+            headers={},
+            links={},
+            content=orjson.dumps(payload),
+            raise_for_status=lambda: None,
+        )
 
-    @patch("requests.get")
-    def test_successful_assignment_event(self, mock_get):
-        """Test successful retrieval of assignment event."""
-        # Mock response data
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {
-                "event": "assigned",
-                "assignee": {"login": "testuser"},
-                "created_at": "2024-01-01T12:00:00Z",
-            }
-        ]
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-
-        result = check_issue_assignment_events(self.issue_link)
-
-        self.assertEqual(result["assignee"], "testuser")
-        self.assertEqual(result["assigned_at"], "2024-01-01T12:00:00Z")
-
-    @patch("requests.get")
-    def test_multiple_assignment_events(self, mock_get):
-        """Test that only the last assignment event is returned."""
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {
-                "event": "assigned",
-                "assignee": {"login": "user1"},
-                "created_at": "2024-01-01T12:00:00Z",
-            },
-            {
-                "event": "assigned",
-                "assignee": {"login": "user2"},
-                "created_at": "2024-01-02T12:00:00Z",
-            },
-        ]
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+    def test_assignment_events(self):
+        """Test the assignment info extracted from different events payloads."""
+        for case, (payload, expected) in self.ASSIGNMENT_EVENT_CASES.items():
+            with self.subTest(case=case):
+                self.mock_response(payload)
 
-        result = check_issue_assignment_events(self.issue_link)
+                result = check_issue_assignment_events(self.issue_link)
 
-        self.assertEqual(result["assignee"], "user2")
-        self.assertEqual(result["assigned_at"], "2024-01-02T12:00:00Z")
+                self.assertEqual(result, expected)
 
-    @patch("requests.get")
-    def test_no_assignment_events(self, mock_get):
-        """Test when there are no assignment events."""
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {"event": "labeled", "label": {"name": "bug"}}
-        ]
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+    def test_request_exception(self):
+        """Test handling of request exceptions."""
+        self.mock_get.side_effect = requests.exceptions.RequestException(
+            "Network error"
+        )
 
         result = check_issue_assignment_events(self.issue_link)
 
         self.assertEqual(result, {})
 
-    @patch("requests.get")
-    def test_request_exception(self, mock_get):
-        """Test handling of request exceptions."""
-        mock_get.side_effect = requests.exceptions.RequestException("Network error")
+    def test_invalid_json(self):
+        """Test handling of a response body that is not valid JSON."""
+        self.mock_get.return_value.content = b"<html></html>"
 
         result = check_issue_assignment_events(self.issue_link)
 
         self.assertEqual(result, {})
 
-    @patch("requests.get")
-    def test_missing_events_url(self, mock_get):
+    def test_missing_events_url(self):
         """Test handling of missing events_url."""
         issue_without_url = {}
 
@@ -153,49 +353,167 @@ class TestCheckIssueAssignmentEvents(TestCase):
         self.assertEqual(result, {})
 
 
-    @patch("requests.get")
-    def test_malformed_response(self, mock_get):
-        """Test handling of malformed response data."""
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {
-                "event": "assigned",
-                # Missing assignee and created_at fields
-            }
+class TestGetIssuesWithoutPullRequests(TestCase):
+    def setUp(self):
+        """Set up issues, pull requests and assignment events."""
+        now = datetime.now(timezone.utc)
+        assigned_days_ago = (now - timedelta(days=3)).strftime(GITHUB_DATETIME_FORMAT)
+        assigned_now = now.strftime(GITHUB_DATETIME_FORMAT)
+        # relativedelta only counted the day of month, e.g. 0 for a whole month
+        assigned_month_ago = (now - timedelta(days=31)).strftime(GITHUB_DATETIME_FORMAT)
+
+        self.issues = [
+            {"number": 1, "assignee": {"login": "alice"}},
+            {"number": 2, "assignee": {"login": "bob"}},
+            {"number": 3, "assignee": {"login": "carol"}},
+            {"number": 4, "assignee": {"login": "dave"}},
+        ]
+        self.pull_requests = [{"user": {"login": "bob"}}]
+        self.assignments = {
+            1: {"assignee": "alice", "assigned_at": assigned_days_ago},
+            2: {"assignee": "bob", "assigned_at": assigned_days_ago},
+            3: {"assignee": "carol", "assigned_at": assigned_now},
+            4: {"assignee": "dave", "assigned_at": assigned_month_ago},
+        }
+
+        for name, mock in (
+            ("get_all_open_and_assigned_issues", lambda url: self.issues),
+            ("get_all_open_pull_requests", lambda url: self.pull_requests),
+            (
+                "check_issue_assignment_events",
+                lambda issue: self.assignments[issue["number"]],
+            ),
+        ):
+            patcher = patch(f"tracker.utils.{name}", side_effect=mock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_only_stale_issues_without_pull_requests(self):
+        """Test issues assigned for over a day with no PR by the assignee are returned."""
+        result = get_issues_without_pull_requests("issues_url", "pulls_url")
+
+        self.assertEqual([issue["number"] for issue in result], [1, 4])
+        self.assertEqual(result[0]["days"], 3)
+        self.assertEqual(result[0]["assignment_info"], self.assignments[1])
+
+    def test_days_count_whole_months(self):
+        """Test the days since assignment are the total days, not the day of month."""
+        result = get_issues_without_pull_requests("issues_url", "pulls_url")
+
+        self.assertEqual(result[1]["number"], 4)
+        self.assertEqual(result[1]["days"], 31)
+
+
+class TestGetUserRevisions(TestCase):
+    def setUp(self):
+        """Set up repositories, open pull requests and their reviews."""
+        self.reviews = {
+            "https://api.github.com/repos/owner/repo1/pulls/1/reviews": [
+                {"user": {"login": "reviewer"}, "state": "APPROVED"}
+            ],
+            "https://api.github.com/repos/owner/repo1/pulls/2/reviews": [],
+            "https://api.github.com/repos/owner/repo2/pulls/3/reviews": [
+                {"user": {"login": "reviewer"}, "state": "CHANGES_REQUESTED"}
+            ],
+        }
+        self.pulls = {
+            "https://api.github.com/repos/owner/repo1/pulls": [
+                {"number": 1, "title": "First"},
+                {"number": 2, "title": "Second"},
+            ],
+            "https://api.github.com/repos/owner/repo2/pulls": [
+                {"number": 3, "title": "Third"}
+            ],
+        }
+
+        for name, mock in (
+            (
+                "get_user_repositories",
+                lambda tele_id: [
+                    {"author": "owner", "name": "repo1"},
+                    {"author": "owner", "name": "repo2"},
+                ],
+            ),
+            ("get_all_open_pull_requests", lambda url: self.pulls[url]),
+            ("get_pull_reviews", lambda url: self.reviews[url]),
+        ):
+            patcher = patch(f"tracker.utils.{name}", side_effect=mock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_reviews_of_open_pull_requests(self):
+        """Test only pull requests with reviews are returned, in repository order."""
+        result = get_user_revisions(TELEGRAM_ID)
+
+        self.assertEqual(
+            result,
+            [
+                {
+                    "repo": "repo1",
+                    "pull": "First",
+                    "reviews": [{"user": {"login": "reviewer"}, "state": "APPROVED"}],
+                },
+                {
+                    "repo": "repo2",
+                    "pull": "Third",
+                    "reviews": [
+                        {"user": {"login": "reviewer"}, "state": "CHANGES_REQUESTED"}
+                    ],
+                },
+            ],
+        )
+
+
+class TestGetContributorIssues(TestCase):
+    def setUp(self):
+        """Set up searched issues with and without matching labels."""
+        self.issues = [
+            {"title": "Hack", "state": "open", "labels": [{"name": "ODHack 10"}]},
+            {"title": "Bug", "state": "open", "labels": [{"name": "bug"}]},
+            {"title": "Plain", "state": "open", "labels": []},
+            {"title": "Done", "state": "closed", "labels": [{"name": "odhack"}]},
         ]
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
 
-        result = check_issue_assignment_events(self.issue_link)
+        patcher = patch(
+            "tracker.utils.get_github_json", return_value={"items": self.issues}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_titles(self, issues: list[str]) -> list[str]:
+        """Extract the issue titles from the formatted issue lines."""
+        return [re.search(r">(.*)</a>", issue).group(1) for issue in issues]
 
-        self.assertEqual(result["assignee"], "")
-        self.assertEqual(result["assigned_at"], "")
+    def test_match_label(self):
+        """Test only open issues with a label matching the regex are returned."""
+        result = get_contributor_issues("user", True, True, r"odhack")
 
+        self.assertEqual(self.get_titles(result), ["Hack"])
 
-class TestCreateTelegramUser(TransactionTestCase):
+    def test_without_label_matching(self):
+        """Test all open issues are returned, including unlabeled ones."""
+        result = get_contributor_issues("user", True)
+
+        self.assertEqual(self.get_titles(result), ["Hack", "Bug", "Plain"])
+
+
+class TestCreateTelegramUser(TestCase):
     def setUp(self):
         """Set up test data."""
         self.custom_user = CustomUser.objects.create(
             email=f"test_create_user_{fake.email()}", role=Roles.CONTRIBUTOR
         )
-        self.telegram_id = str(fake.random_int(min=10000000000, max=99999999999))
-
-    def tearDown(self):
-        """Clean up after each test."""
-        TelegramUser.objects.filter(user=self.custom_user).delete()
-        self.custom_user.delete()
+        self.telegram_id = LONG_TELEGRAM_ID
 
     def test_create_new_telegram_user(self):
         """Test creating a new telegram user when one doesn't exist."""
-        TelegramUser.objects.filter(user=self.custom_user).delete()
-
         self.assertFalse(
             TelegramUser.objects.filter(
                 telegram_id=self.telegram_id, user=self.custom_user
             ).exists()
         )
 
-        async_to_sync(create_telegram_user)(self.custom_user, self.telegram_id)
+        _sync_create_telegram_user(self.custom_user, self.telegram_id)
 
         telegram_user = TelegramUser.objects.get(
             telegram_id=self.telegram_id, user=self.custom_user
@@ -206,15 +524,14 @@ class TestCreateTelegramUser(TransactionTestCase):
 
     def test_avoid_duplicate_telegram_user(self):
         """Test that no duplicate telegram user is created if one already exists."""
-        TelegramUser.objects.filter(user=self.custom_user).delete()
-
         TelegramUser.objects.create(user=self.custom_user, telegram_id=self.telegram_id)
 
         initial_count = TelegramUser.objects.filter(
             telegram_id=self.telegram_id, user=self.custom_user
         ).count()
 
-        async_to_sync(create_telegram_user)(self.custom_user, self.telegram_id)
+        with self.assertNumQueries(1):
+            _sync_create_telegram_user(self.custom_user, self.telegram_id)
 
         final_count = TelegramUser.objects.filter(
             telegram_id=self.telegram_id, user=self.custom_user
@@ -222,24 +539,132 @@ class TestCreateTelegramUser(TransactionTestCase):
         self.assertEqual(initial_count, final_count)
         self.assertEqual(final_count, 1)
 
-    def test_create_telegram_user_different_formats(self):
-        """Test creating telegram users with different ID formats."""
-        TelegramUser.objects.filter(user=self.custom_user).delete()
+    def assert_telegram_user_created(self, telegram_id: str) -> None:
+        """Create a telegram user with the given ID and check it was saved as is."""
+        _sync_create_telegram_user(self.custom_user, telegram_id)
 
-        test_ids = [
-            "123456789",
-            "0123456789",
-            str(fake.random_int(min=10000000000, max=99999999999)),
-        ]
+        telegram_user = TelegramUser.objects.get(
+            telegram_id=telegram_id, user=self.custom_user
+        )
+        self.assertIsNotNone(telegram_user)
+
+    def test_create_telegram_user_numeric_id(self):
+        """Test creating a telegram user with a plain numeric ID."""
+        self.assert_telegram_user_created("123456789")
+
+    def test_create_telegram_user_leading_zero_id(self):
+        """Test creating a telegram user with an ID that has a leading zero."""
+        self.assert_telegram_user_created("0123456789")
+
+    def test_create_telegram_user_long_id(self):
+        """Test creating a telegram user with an 11-digit ID."""
+        self.assert_telegram_user_created(LONG_TELEGRAM_ID)
+
+
+class TestGetRepositoryFromIssue(TestCase):
+    def test_repository_url(self):
+        """Test the author and name are taken from the issue's repository URL."""
+        for repository_url in (
+            "https://api.github.com/repos/owner/repo",
+            "https://api.github.com/repos/owner/repo/",
+        ):
+            with self.subTest(repository_url=repository_url):
+                result = get_repository_from_issue({"repository_url": repository_url})
+
+                self.assertEqual(result, {"author": "owner", "name": "repo"})
+
+    def test_missing_repository_url(self):
+        """Test an issue without a repository URL returns an empty dict."""
+        self.assertEqual(get_repository_from_issue({}), {})
+
+
+class TestGetRepositoryTimeLimit(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the whole class."""
+        cls.custom_user = CustomUser.objects.create(
+            email=fake.email(), role=Roles.CONTRIBUTOR
+        )
+        cls.repository = Repository.objects.create(
+            user=cls.custom_user, author="owner", name="repo", time_limit=3600
+        )
+
+    def test_time_limit(self):
+        """Test the time limit is read with a single query."""
+        with self.assertNumQueries(1):
+            result = get_repository_time_limit(author="owner", name="repo")
+
+        self.assertEqual(result, 3600)
+
+    def test_missing_repository(self):
+        """Test a missing repository returns None."""
+        self.assertIsNone(get_repository_time_limit(author="owner", name="missing"))
+
+
+class TestParseGithubDatetime(TestCase):
+    def test_parse_github_datetime(self):
+        """Test API timestamps are parsed into aware UTC datetimes."""
+        assigned_at = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+
+        result = parse_github_datetime(assigned_at.strftime(GITHUB_DATETIME_FORMAT))
+
+        self.assertEqual(result, assigned_at)
+
+
+class TestGithubUrls(TestCase):
+    def test_get_issues_url(self):
+        """Test building the issues endpoint of a repository."""
+        self.assertEqual(
+            get_issues_url("owner", "repo"),
+            "https://api.github.com/repos/owner/repo/issues",
+        )
+
+    def test_get_pulls_url(self):
+        """Test building the pull requests endpoint of a repository."""
+        self.assertEqual(
+            get_pulls_url("owner", "repo"),
+            "https://api.github.com/repos/owner/repo/pulls",
+        )
+
+    def test_get_pull_reviews_url(self):
+        """Test building the reviews endpoint of a pull request."""
+        self.assertEqual(
+            get_pull_reviews_url("owner", "repo", 1),
+            "https://api.github.com/repos/owner/repo/pulls/1/reviews",
+        )
+
+    def test_get_issues_search_url(self):
+        """Test building the search endpoint of a user's assigned issues."""
+        self.assertEqual(
+            get_issues_search_url("user"),
+            "https://api.github.com/search/issues?q=assignee:user+is:issue",
+        )
+
+
+class TestSplitMessage(TestCase):
+    def test_short_message_is_sent_whole(self):
+        """Test parts that fit the limit are joined into one message."""
+        result = split_message(["header\n", "body\n", "footer"], max_length=100)
+
+        self.assertEqual(result, ["header\nbody\nfooter"])
+
+    def test_long_message_is_split_between_parts(self):
+        """Test messages are split on part boundaries only."""
+        parts = ["<b>aaaa</b>", "<b>bbbb</b>", "<b>cccc</b>"]
+
+        result = split_message(parts, max_length=22)
+
+        self.assertEqual(result, ["<b>aaaa</b><b>bbbb</b>", "<b>cccc</b>"])
 
-        for test_id in test_ids:
-            with self.subTest(telegram_id=test_id):
+    def test_oversized_part_is_split(self):
+        """Test a part longer than the limit is cut into messages within the limit."""
+        result = split_message(["a" * 10, "b"], max_length=4)
 
-                TelegramUser.objects.filter(user=self.custom_user).delete()
+        self.assertTrue(all(len(message) <= 4 for message in result))
+        self.assertEqual("".join(result), "a" * 10 + "b")
 
-                async_to_sync(create_telegram_user)(self.custom_user, test_id)
+    def test_oversized_part_is_split_at_line_breaks(self):
+        """Test an oversized part is cut at the last line break that fits."""
+        result = split_message(["aa\nbb\ncc"], max_length=6)
 
-                telegram_user = TelegramUser.objects.get(
-                    telegram_id=test_id, user=self.custom_user
-                )
-                self.assertIsNotNone(telegram_user)
+        self.assertEqual(result, ["aa\nbb\n", "cc"])
@@ -0,0 +1,14 @@
+from faker import Faker
+
+fake = Faker()
+
+TELEGRAM_ID: str = str(fake.random_int(min=100000000, max=9999999999))
+LONG_TELEGRAM_ID: str = str(fake.random_int(min=10000000000, max=99999999999))
+
+# The GitHub API timestamp format, used to build parse_github_datetime fixtures
+GITHUB_DATETIME_FORMAT: str = "%Y-%m-%dT%H:%M:%SZ"
+
+# The cache of the whole test run, so clearing it never flushes a shared Redis database
+LOCMEM_CACHES: dict = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
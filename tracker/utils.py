@@ -1,25 +1,69 @@
+import hashlib
 import logging
 import re
-from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from urllib.parse import urlencode
 
+import orjson
 import requests
 from aiogram import html
-from asgiref.sync import async_to_sync, sync_to_async
-from dateutil.relativedelta import relativedelta
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db.models import Prefetch
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from .values import (
-    DATETIME_FORMAT,
+    GITHUB_CACHE_KEY,
+    GITHUB_CACHE_TIMEOUT,
+    GITHUB_ISSUES_SEARCH_URL,
+    GITHUB_MAX_PAGES,
+    GITHUB_MAX_RETRIES,
+    GITHUB_MAX_WORKERS,
+    GITHUB_PER_PAGE,
+    GITHUB_REPOS_URL,
+    GITHUB_REQUEST_TIMEOUT,
     HEADERS,
-    ISSUES_SEARCH,
-    PULLS_REVIEWS_URL,
-    PULLS_URL,
     SECONDS_IN_AN_HOUR,
+    TELEGRAM_MESSAGE_MAX_LENGTH,
 )
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Reuse connections to the GitHub API instead of a new TLS handshake per request.
+# Every fan-out thread shares this pool, so requests wait for a free connection
+# instead of opening extra ones, which caps concurrent requests per process.
+github_session = requests.Session()
+github_session.headers.update(HEADERS)
+github_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_maxsize=GITHUB_MAX_WORKERS,
+        pool_block=True,
+        max_retries=Retry(
+            total=GITHUB_MAX_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=(
+                HTTPStatus.BAD_GATEWAY,
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                HTTPStatus.GATEWAY_TIMEOUT,
+            ),
+            allowed_methods=("GET",),
+        ),
+    ),
+)
+
+# Runs the GitHub requests of every fan-out. Its threads live as long as the process,
+# so their thread-local cache connections stay open between calls. Tasks submitted
+# here must not submit and wait on tasks of their own, or the pool can deadlock.
+github_executor = ThreadPoolExecutor(
+    max_workers=GITHUB_MAX_WORKERS, thread_name_prefix="github"
+)
+
 
 def escape_html(text: str) -> str:
     """
@@ -32,35 +76,99 @@ def escape_html(text: str) -> str:
     return html.unparse(text)
 
 
-@sync_to_async
-def get_all_repostitories(tele_id: str) -> list[dict]:
+def parse_github_datetime(value: str) -> datetime:
     """
-    A function that returns a list of repositories asyncronously.
+    Parses a GitHub API timestamp such as "2024-01-01T12:00:00Z".
+    `datetime.fromisoformat` accepts the trailing "Z" since Python 3.11 and is
+    considerably faster than `datetime.strptime`.
+
+    :param value: The ISO 8601 timestamp returned by the API.
+    :return: A timezone-aware datetime in UTC.
+    """
+    return datetime.fromisoformat(value)
+
+
+def get_issues_url(owner: str, repo: str) -> str:
+    """
+    Builds the GitHub API endpoint for the issues of a repository.
+
+    :param owner: The author of the repository.
+    :param repo: The name of the repository.
+    :return: The issues API endpoint.
+    """
+    return f"{GITHUB_REPOS_URL}/{owner}/{repo}/issues"
+
+
+def get_pulls_url(owner: str, repo: str) -> str:
+    """
+    Builds the GitHub API endpoint for the pull requests of a repository.
+
+    :param owner: The author of the repository.
+    :param repo: The name of the repository.
+    :return: The pull requests API endpoint.
+    """
+    return f"{GITHUB_REPOS_URL}/{owner}/{repo}/pulls"
+
+
+def get_pull_reviews_url(owner: str, repo: str, pull_number: int) -> str:
+    """
+    Builds the GitHub API endpoint for the reviews of a pull request.
+
+    :param owner: The author of the repository.
+    :param repo: The name of the repository.
+    :param pull_number: The number of the pull request.
+    :return: The pull request reviews API endpoint.
+    """
+    return f"{GITHUB_REPOS_URL}/{owner}/{repo}/pulls/{pull_number}/reviews"
+
+
+def get_issues_search_url(username: str) -> str:
+    """
+    Builds the GitHub API search endpoint for the issues assigned to a user.
+
+    :param username: The username of the github account.
+    :return: The issues search API endpoint.
+    """
+    return f"{GITHUB_ISSUES_SEARCH_URL}?q=assignee:{username}+is:issue"
+
+
+def get_user_repositories(tele_id: str) -> list[dict]:
+    """
+    A function that returns a list of repositories of a telegram user.
+    Only the fields used to build the GitHub API endpoints and deadlines are selected.
     :param tele_id: str
     :return: Repositories
     """
-    from .models import TelegramUser
+    from .models import Repository
 
-    telegram_user = TelegramUser.objects.filter(telegram_id=tele_id).first()
+    return list(
+        Repository.objects.filter(user__telegramuser__telegram_id=tele_id).values(
+            "author", "name", "time_limit"
+        )
+    )
 
-    if telegram_user:
-        return list(telegram_user.user.repository_set.values())
 
-    return list()
+@sync_to_async
+def get_all_repostitories(tele_id: str) -> list[dict]:
+    """
+    A function that returns a list of repositories asyncronously.
+    :param tele_id: str
+    :return: Repositories
+    """
+    return get_user_repositories(tele_id)
 
 
 @sync_to_async
-def get_user(uuid: str) -> tuple["CustomUser"]:
+def get_user(uuid: str) -> "CustomUser":
     """
     Retunrs an user instantce
+    Only the primary key is loaded, as the user is only linked to a telegram account.
     :param uuid: str
-    :return: tuple(CustomUser, )
+    :return: CustomUser
     """
     from .models import CustomUser
 
-    user = CustomUser.objects.get(id=uuid)
-
-    return (user,)
+    return CustomUser.objects.only("id").get(id=uuid)
 
 
 @sync_to_async
@@ -73,8 +181,109 @@ def create_telegram_user(user: object, telegram_id: str) -> None:
     """
     from .models import TelegramUser
 
-    if not TelegramUser.objects.filter(telegram_id=telegram_id, user=user).exists():
-        TelegramUser.objects.create(user=user, telegram_id=telegram_id)
+    TelegramUser.objects.get_or_create(user=user, telegram_id=telegram_id)
+
+
+def get_cache_key(template: str, resource: str) -> str:
+    """
+    Builds a fixed-length cache key for a resource, so long URLs stay within
+    the key length limits of the cache backends.
+
+    :param template: The key template with a `{key}` placeholder.
+    :param resource: The resource identifier, e.g. a URL.
+    :return: The cache key.
+    """
+    return template.format(
+        key=hashlib.blake2b(resource.encode(), digest_size=16).hexdigest()
+    )
+
+
+def get_github_page(url: str, params: dict = None) -> tuple[list | dict, str | None]:
+    """
+    Sends a conditional GET request to the GitHub API and returns the decoded JSON body
+    together with the link to the next page.
+    The ETag, body and next link of every successful response are cached, and the next
+    request for the same resource sends `If-None-Match`. Unchanged resources are then
+    answered with `304 Not Modified`, which carries no body and does not count against
+    the rate limit.
+
+    :param url: The API endpoint.
+    :param params: Query parameters of the request.
+    :return: The decoded JSON body and the next page URL, or None on the last page.
+    :raises requests.exceptions.RequestException: If the request fails.
+    """
+    resource = f"{url}?{urlencode(sorted((params or dict()).items()))}"
+    cache_key = get_cache_key(GITHUB_CACHE_KEY, resource)
+    cached_response = cache.get(cache_key)
+
+    headers = dict()
+    if cached_response:
+        headers["If-None-Match"] = cached_response["etag"]
+
+    response = github_session.get(
+        url, headers=headers, params=params, timeout=GITHUB_REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+
+    if cached_response and response.status_code == HTTPStatus.NOT_MODIFIED:
+        return cached_response["body"], cached_response["next"]
+
+    try:
+        body = orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        # Keep raising a RequestException, as response.json() does
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+    next_url = response.links.get("next", dict()).get("url")
+
+    etag = response.headers.get("ETag")
+    if etag:
+        cache.set(
+            cache_key,
+            {"etag": etag, "body": body, "next": next_url},
+            GITHUB_CACHE_TIMEOUT,
+        )
+
+    return body, next_url
+
+
+def get_github_json(url: str, params: dict = None) -> list | dict:
+    """
+    Returns the decoded JSON body of a single GitHub API response.
+
+    :param url: The API endpoint.
+    :param params: Query parameters of the request.
+    :return: The decoded JSON body of the response.
+    :raises requests.exceptions.RequestException: If the request fails.
+    """
+    body, _ = get_github_page(url, params=params)
+    return body
+
+
+def get_paginated_github_json(url: str, params: dict = None) -> list[dict]:
+    """
+    Returns the items of a GitHub API list endpoint across pages.
+    Pages are requested with the maximum page size and followed through the `Link`
+    header, up to GITHUB_MAX_PAGES pages to bound the memory used.
+
+    :param url: The API endpoint.
+    :param params: Query parameters of the request.
+    :return: The items of all fetched pages.
+    :raises requests.exceptions.RequestException: If a request fails.
+    """
+    items, next_url = get_github_page(
+        url, params={**(params or dict()), "per_page": GITHUB_PER_PAGE}
+    )
+
+    for _ in range(GITHUB_MAX_PAGES - 1):
+        if not next_url:
+            break
+
+        # The next link already carries all query parameters
+        page, next_url = get_github_page(next_url)
+        items.extend(page)
+
+    return items
 
 
 def check_issue_assignment_events(issue: dict) -> dict:
@@ -93,19 +302,20 @@ def check_issue_assignment_events(issue: dict) -> dict:
     try:
         events_url = issue.get("events_url", str())
 
-        response = requests.get(events_url, headers=HEADERS)
-        response.raise_for_status()
-
-        events = response.json()
+        events = get_paginated_github_json(events_url)
 
-        assignment_info = defaultdict(str)
+        assignment_info = dict()
 
-        for event in events:
+        # Events are listed oldest first and only the latest assignment matters
+        for event in reversed(events):
             if event.get("event") == "assigned":
-                assignment_info["assignee"] = event.get("assignee", {}).get("login", "")
-                assignment_info["assigned_at"] = event.get("created_at", "")
+                assignment_info = {
+                    "assignee": event.get("assignee", {}).get("login", ""),
+                    "assigned_at": event.get("created_at", ""),
+                }
+                break
 
-        return dict(assignment_info)
+        return assignment_info
 
     except requests.exceptions.RequestException as e:
         logger.info(e)
@@ -123,10 +333,7 @@ def get_all_open_and_assigned_issues(url: str) -> list[dict]:
     :return: A list of dictionaries representing open and assigned issues.
     """
     try:
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()
-
-        issues = response.json()
+        issues = get_paginated_github_json(url)
 
         open_assigned_issues = list(
             filter(
@@ -156,12 +363,7 @@ def get_all_open_pull_requests(url: str) -> list[dict]:
     :return: A list of dictionaries representing open pull requests.
     """
     try:
-        response = requests.get(url, headers=HEADERS, params={"state": "open"})
-        response.raise_for_status()
-
-        response = response.json()
-
-        return response
+        return get_paginated_github_json(url, params={"state": "open"})
 
     except requests.exceptions.RequestException as e:
         logger.info(e)
@@ -178,37 +380,40 @@ def get_issues_without_pull_requests(
     :param pull_requests_url: The API endpoint for pull requests.
     :return: List of issues with matched PR details if found.
     """
-    issues = get_all_open_and_assigned_issues(issues_url)
+    # Every issue needs its own events request, so run them concurrently. All requests
+    # go through the shared executor and this thread only waits for their results.
+    pull_requests_future = github_executor.submit(
+        get_all_open_pull_requests, pull_requests_url
+    )
+    issues = github_executor.submit(
+        get_all_open_and_assigned_issues, issues_url
+    ).result()
+    assignments = list(github_executor.map(check_issue_assignment_events, issues))
+    pull_requests = pull_requests_future.result()
 
-    for issue in issues:
-        issue["assignment_info"] = check_issue_assignment_events(issue)
+    now = datetime.now(timezone.utc)
+
+    for issue, assignment_info in zip(issues, assignments):
+        issue["assignment_info"] = assignment_info
         assigned_at = issue.get("assignment_info", dict()).get("assigned_at")
 
-        time_delta = (
-            relativedelta(
-                dt1=datetime.now(),
-                dt2=datetime.strptime(assigned_at, "%Y-%m-%dT%H:%M:%SZ"),
-            )
-            if assigned_at
-            else str()
+        issue["days"] = (
+            (now - parse_github_datetime(assigned_at)).days if assigned_at else 0
         )
 
-        issue["days"] = time_delta.days if time_delta else 0
-
-    pull_requests = get_all_open_pull_requests(pull_requests_url)
-
-    pull_requests_users = [
+    pull_requests_users = {
         pull_request.get("user", dict()).get("login")
         for pull_request in pull_requests
         if pull_request.get("user", dict()).get("login")
-    ]
+    }
 
     result = list()
 
-    for issue in issues.copy():
+    for issue in issues:
+        assignee_login = issue.get("assignee", dict()).get("login")
         if (
             issue.get("days", 0) >= 1 # TODO make it correspond to repository settings
-            and issue.get("assignee", dict()).get("login") not in pull_requests_users
+            and assignee_login not in pull_requests_users
         ):
             result.append(issue)
 
@@ -224,10 +429,7 @@ def get_all_available_issues(url: str) -> list[dict]:
     :return: A list of dictionaries representing available issues or an empty list if an error occurs.
     """
     try:
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()
-
-        issues = response.json()
+        issues = get_paginated_github_json(url)
 
         available_issues = list(
             filter(
@@ -257,11 +459,7 @@ def get_pull_reviews(url: str) -> list[dict]:
     :return: A list of dictionaries representing available issues.
     """
     try:
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()
-
-        if response.ok:
-            return response.json()
+        return get_paginated_github_json(url)
     except requests.exceptions.RequestException as e:
         logger.info(e)
     return []
@@ -273,25 +471,31 @@ def get_user_revisions(telegram_id: str) -> list[dict]:
     :params tele_id: The TelegramUser id of the user
     :return: A list of reviews for all the user repos open PRS
     """
-    repos = async_to_sync(get_all_repostitories)(telegram_id)
+    repos = get_user_repositories(telegram_id)
     reviews_list = []
-    for repo in repos:
-        pulls = get_all_open_pull_requests(
-            PULLS_URL.format(owner=repo.get("author", ""), repo=repo.get("name", ""))
+
+    repos_pulls = github_executor.map(
+        get_all_open_pull_requests,
+        [get_pulls_url(repo.get("author", ""), repo.get("name", "")) for repo in repos],
+    )
+    for repo, pulls in zip(repos, repos_pulls):
+        owner = repo.get("author", "")
+        repo_name = repo.get("name", "")
+
+        # Reviews of every open PR of the repository are fetched concurrently
+        pulls_reviews = github_executor.map(
+            get_pull_reviews,
+            [get_pull_reviews_url(owner, repo_name, pull["number"]) for pull in pulls],
         )
-        return_data = {"repo": repo.get("name", "")}
-        for pull in pulls:
-            return_data["pull"] = pull.get("title", "")  # add the pull title
-            reviews_data = get_pull_reviews(
-                url=PULLS_REVIEWS_URL.format(
-                    owner=repo.get("author", ""),
-                    repo=repo.get("name", ""),
-                    pull_number=pull["number"],
-                )
-            )
+        for pull, reviews_data in zip(pulls, pulls_reviews):
             if reviews_data:
-                return_data["reviews"] = reviews_data
-                reviews_list.append(return_data.copy())
+                reviews_list.append(
+                    {
+                        "repo": repo_name,
+                        "pull": pull.get("title", ""),
+                        "reviews": reviews_data,
+                    }
+                )
     return reviews_list
 
 
@@ -303,24 +507,22 @@ def get_contributor_issues(
     :param username: The username of the github account.
     :return: A list representing issues assigned.
     """
-    api_url = ISSUES_SEARCH.format(username=username)
+    api_url = get_issues_search_url(username)
+    pattern = re.compile(regex, re.IGNORECASE) if match_label else None
 
     try:
-        response = requests.get(api_url, headers=HEADERS)
-        response.raise_for_status()
-
-        issues = response.json().get("items", [])
+        issues = get_github_json(api_url).get("items", [])
         issues_format = []
         for issue in issues:
 
             if is_state_open and issue.get("state") != "open":
                 continue
 
-            labels = [label.get("name") for label in issue.get("labels", [])]
-            for label in labels:
-                if not match_label or re.search(regex, label, re.IGNORECASE):
-                    issues_format.append(f"Issue: {attach_link_to_issue(issue)}")
-                    break
+            if not pattern or any(
+                pattern.search(label.get("name", ""))
+                for label in issue.get("labels", [])
+            ):
+                issues_format.append(f"Issue: {attach_link_to_issue(issue)}")
 
         return issues_format
 
@@ -347,11 +549,29 @@ def attach_link_to_issue(issue: dict) -> str:
 def get_repository_from_issue(issue: dict) -> dict:
     repository_url = issue.get("repository_url", "")
     if repository_url:
-        parts = repository_url.rstrip("/").split("/")
-        return {"author": parts[-2], "name": parts[-1]}
+        head, _, name = repository_url.rstrip("/").rpartition("/")
+        return {"author": head.rpartition("/")[2], "name": name}
     return {}
 
 
+def get_repository_time_limit(author: str, name: str) -> int | None:
+    """
+    Returns the time limit of a repository in seconds.
+    Only this column is selected instead of loading the whole repository row.
+
+    :param author: The author of the repository.
+    :param name: The name of the repository.
+    :return: The time limit in seconds, or None if the repository does not exist.
+    """
+    from .models import Repository
+
+    return (
+        Repository.objects.filter(author=author, name=name)
+        .values_list("time_limit", flat=True)
+        .first()
+    )
+
+
 def get_time_before_deadline(issue: dict) -> str:
     """
     Returns the time remaining before the deadline of an assigned issue.
@@ -371,16 +591,13 @@ def get_time_before_deadline(issue: dict) -> str:
     if not repository_details:
         return "Repository details not found."
 
-    from .models import Repository
-
-    repo = Repository.objects.get(
+    time_limit_seconds = get_repository_time_limit(
         author=repository_details.get("author"), name=repository_details.get("name")
     )
-    time_limit_seconds = repo.time_limit
+    if time_limit_seconds is None:
+        return "Repository details not found."
 
-    assigned_time = datetime.strptime(assigned_at, DATETIME_FORMAT).replace(
-        tzinfo=timezone.utc
-    )
+    assigned_time = parse_github_datetime(assigned_at)
     deadline_datetime = assigned_time + timedelta(seconds=time_limit_seconds)
     now = datetime.now(timezone.utc)
 
@@ -391,6 +608,57 @@ def get_time_before_deadline(issue: dict) -> str:
         return "Deadline has passed."
 
 
+def split_oversized_parts(parts: list[str], max_length: int) -> Iterator[str]:
+    """
+    Yields the message parts, cutting every part longer than max_length into pieces.
+    A piece ends at the last line break that fits, or at max_length if there is none.
+
+    :param parts: The ordered pieces of the message
+    :param max_length: The maximum length of a single piece
+    :return: An iterator over pieces no longer than max_length
+    """
+    for part in parts:
+        while len(part) > max_length:
+            cut = part.rfind("\n", 0, max_length) + 1 or max_length
+            yield part[:cut]
+            part = part[cut:]
+
+        if part:
+            yield part
+
+
+def split_message(
+    parts: list[str], max_length: int = TELEGRAM_MESSAGE_MAX_LENGTH
+) -> list[str]:
+    """
+    Joins message parts into as few messages as possible without exceeding max_length.
+    Parts that fit are never split, so HTML markup inside them stays intact. A part
+    longer than max_length is cut into pieces, preferably at line breaks, as Telegram
+    rejects longer messages.
+
+    :param parts: The ordered pieces of the message
+    :param max_length: The maximum length of a single message
+    :return: A list of messages ready to be sent
+    """
+    messages = []
+    current_parts = []
+    current_length = 0
+
+    for part in split_oversized_parts(parts, max_length):
+        if current_parts and current_length + len(part) > max_length:
+            messages.append("".join(current_parts))
+            current_parts = []
+            current_length = 0
+
+        current_parts.append(part)
+        current_length += len(part)
+
+    if current_parts:
+        messages.append("".join(current_parts))
+
+    return messages
+
+
 def get_support_link(telegram_username: str) -> str:
     """
     Creates a clickable Telegram DM link for support.
@@ -407,17 +675,19 @@ def get_support_link(telegram_username: str) -> str:
 
 
 @sync_to_async
-def get_repository_support(author: str, repo_name: str) -> "Support":
+def get_repositories_with_support(tele_id: str) -> list["Repository"]:
     """
-    Gets the support contact for a specific repository.
+    Returns the repositories of a telegram user with their support contacts prefetched.
+    Supports are loaded in a single extra query instead of one lookup per repository.
 
-    :param author: Repository author
-    :param repo_name: Repository name
-    :return: Support instance or None
+    :param tele_id: Telegram id of the user
+    :return: A list of Repository instances with a `supports` attribute
     """
     from .models import Repository, Support
 
-    repository = Repository.objects.filter(author=author, name=repo_name).first()
-    if repository:
-        return Support.objects.filter(user=repository.user, repository=repository).first()
-    return None
+    supports = Support.objects.filter(user__telegramuser__telegram_id=tele_id)
+    repositories = Repository.objects.filter(
+        user__telegramuser__telegram_id=tele_id
+    ).prefetch_related(Prefetch("support_set", queryset=supports, to_attr="supports"))
+
+    return list(repositories)
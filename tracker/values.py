@@ -5,16 +5,10 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-ISSUES_URL: str = "https://api.github.com/repos/{owner}/{repo}/issues"
-PULLS_URL: str = "https://api.github.com/repos/{owner}/{repo}/pulls"
-PULLS_REVIEWS_URL: str = (
-    "https://api.github.com/repos/{owner}/{repo}/pulls/{pull_number}/reviews"
-)
+GITHUB_REPOS_URL: str = "https://api.github.com/repos"
+GITHUB_ISSUES_SEARCH_URL: str = "https://api.github.com/search/issues"
 
 ROLE_MAX_CHARACTER_LENGTH: int = 11
-ISSUES_SEARCH: str = (
-    "https://api.github.com/search/issues?q=assignee:{username}+is:issue"
-)
 
 HEADERS: dict = {
     "Accept": "application/vnd.github+json",
@@ -22,8 +16,23 @@ HEADERS: dict = {
     "X-GitHub-Api-Version": "2022-11-28",
 }
 
-DATETIME_FORMAT: str = "%Y-%m-%dT%H:%M:%SZ"
+GITHUB_MAX_WORKERS: int = 16
+GITHUB_MAX_RETRIES: int = 3
+# Connect and read timeouts in seconds, so a stalled connection cannot hold a thread
+GITHUB_REQUEST_TIMEOUT: tuple[float, float] = (5, 30)
+GITHUB_PER_PAGE: int = 100
+GITHUB_MAX_PAGES: int = 10
+GITHUB_CACHE_KEY: str = "github:{key}"
+# An ETag stays valid until the resource changes, so the timeout only bounds how long
+# an entry is stored: long enough for the next hourly approvals poll to revalidate it
+GITHUB_CACHE_TIMEOUT: int = 7200
+
 SECONDS_IN_AN_HOUR: int = 3600
+TELEGRAM_MESSAGE_MAX_LENGTH: int = 4096
+
+TELEGRAM_LINK_TEMPLATE: str = (
+    '<a href="{}" target="_blank">Get info about repository</a>'
+)
 
 
 @dataclass(frozen=True)